@@ -124,11 +124,16 @@ class StageCoupledTimeStepper(BaseTimeStepper):
 
         self.prob = NonlinearVariationalProblem(Fbig, stages, bigBCs)
 
-        push_parent(self.u0.function_space().dm, self.stages.function_space().dm)
+        # The stage DM only needs u0's DM as its parent while we solve.
+        # Keeping it pushed for the lifetime of the stepper would leak
+        # into other solvers on the same space, so we push and pop around
+        # each solve, but look up the pair of DMs just once.
+        self.parent_dms = (self.u0.function_space().dm, self.stages.function_space().dm)
+        push_parent(*self.parent_dms)
         self.solver = NonlinearVariationalSolver(
             self.prob, appctx=self.appctx, nullspace=nsp,
             solver_parameters=solver_parameters)
-        pop_parent(self.u0.function_space().dm, self.stages.function_space().dm)
+        pop_parent(*self.parent_dms)
 
         # stash these for later in case we do bounds constraints
         self.stage_bounds = self.get_stage_bounds(bounds)
@@ -137,9 +142,9 @@ class StageCoupledTimeStepper(BaseTimeStepper):
         """Advances the system from time `t` to time `t + dt`.
         Note: overwrites the value `u0`."""
 
-        push_parent(self.u0.function_space().dm, self.stages.function_space().dm)
+        push_parent(*self.parent_dms)
         self.solver.solve(bounds=self.stage_bounds)
-        pop_parent(self.u0.function_space().dm, self.stages.function_space().dm)
+        pop_parent(*self.parent_dms)
 
         self.num_steps += 1
         self.num_nonlinear_iterations += self.solver.snes.getIterationNumber()
@@ -141,6 +141,13 @@ class DIRKTimeStepper:
         self.kgac = k, g, a, c
         self.bc_constants = a_vals, d_val
 
+        # The already-known part of each stage and the final update are
+        # fixed combinations of the stored stage values, so build them once
+        ks = self.ks
+        self.stage_known_exprs = [sum((ks[j] * (self.AA[i, j] * dt) for j in range(i)), u0)
+                                  for i in range(num_stages)]
+        self.update_expr = sum(ks[i] * (self.BB[i] * dt) for i in range(num_stages))
+
     def update_bc_constants(self, i, c):
         AAb = self.AAb
         CCone = self.CCone
@@ -156,12 +163,10 @@ class DIRKTimeStepper:
     def advance(self):
         k, g, a, c = self.kgac
         ks = self.ks
-        u0 = self.u0
-        dt = self.dt
         for i in range(self.num_stages):
             # compute the already-known part of the state in the
             # variational form
-            g.assign(sum((ks[j] * (self.AA[i, j] * dt) for j in range(i)), u0))
+            g.assign(self.stage_known_exprs[i])
 
             # update BC constants for the variational problem
             self.update_bc_constants(i, c)
@@ -181,7 +186,7 @@ class DIRKTimeStepper:
             ks[i].assign(k)
 
         # update the solution with now-computed stage values.
-        u0 += sum(ks[i] * (self.BB[i] * dt) for i in range(self.num_stages))
+        self.u0 += self.update_expr
 
         self.num_steps += 1
 
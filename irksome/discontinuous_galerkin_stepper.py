@@ -1,3 +1,4 @@
+from functools import lru_cache
 from FIAT import (Bernstein, DiscontinuousElement,
                   DiscontinuousLagrange,
                   Legendre,
@@ -5,13 +6,72 @@ from FIAT import (Bernstein, DiscontinuousElement,
 from ufl.constantvalue import as_ufl
 from .base_time_stepper import StageCoupledTimeStepper
 from .bcs import stage2spaces4bc
-from .deriv import expand_time_derivatives
-from .manipulation import extract_terms, strip_dt_form
+from .deriv import TimeDerivative, expand_time_derivatives
+from .manipulation import extract_terms
 from .tools import replace, vecconst
 import numpy as np
 from firedrake import TestFunction
 
 
+@lru_cache(maxsize=None)
+def getElementDiscGalerkin(order, basis_type=None):
+    """Returns the :class:`FIAT.FiniteElement` used in time for the
+    DG-in-time method of a given order and basis type.  Elements are
+    cached so that steppers with the same configuration share their
+    tabulations (see :func:`tabulateDiscGalerkin`)."""
+    ufc_line = ufc_simplex(1)
+    if order == 0:
+        return DiscontinuousLagrange(ufc_line, order)
+    elif basis_type == "Bernstein":
+        return DiscontinuousElement(Bernstein(ufc_line, order))
+    elif basis_type == "integral":
+        return Legendre(ufc_line, order)
+    else:
+        # Let recursivenodes handle the general case
+        variant = None if basis_type == "Lagrange" else basis_type
+        return DiscontinuousLagrange(ufc_line, order, variant=variant)
+
+
+@lru_cache(maxsize=None)
+def getQuadratureDiscGalerkin(order):
+    """Returns the default (Gauss-Legendre) :class:`FIAT.QuadratureRule`
+    in time for the DG-in-time method of a given order."""
+    return make_quadrature(ufc_simplex(1), order+1)
+
+
+@lru_cache(maxsize=32)
+def tabulateDiscGalerkin(L, Q):
+    """Tabulates the temporal basis `L` on the quadrature rule `Q`.
+
+    Returns a tuple of numpy arrays holding the basis values and
+    derivatives at the quadrature points, the basis values scaled
+    by the quadrature weights, the L2 projector onto `L`, and the
+    basis values at the left endpoint.  The results are cached and
+    shared, so the arrays are read-only.
+    """
+    qpts = Q.get_points()
+    qwts = Q.get_weights()
+
+    tabulate_basis = L.tabulate(1, qpts)
+    basis_vals = tabulate_basis[(0,)]
+    basis_dvals = tabulate_basis[(1,)]
+    basis_vals_w = np.multiply(basis_vals, qwts)
+
+    # mass matrix later for BC
+    mmat = basis_vals_w @ basis_vals.T
+    # L2 projector
+    proj = np.linalg.solve(mmat, basis_vals_w)
+
+    L_at_0 = L.tabulate(0, (0.0,))[(0,)]
+
+    # Copy so that freezing the tables never touches FIAT's own arrays
+    tables = tuple(np.array(table) for table in
+                   (basis_vals, basis_dvals, basis_vals_w, proj, L_at_0))
+    for table in tables:
+        table.setflags(write=False)
+    return tables
+
+
 def getFormDiscGalerkin(F, L, Q, t, dt, u0, stages, bcs=None):
 
     """Given a time-dependent variational form, trial and test spaces, and
@@ -56,17 +116,8 @@ def getFormDiscGalerkin(F, L, Q, t, dt, u0, stages, bcs=None):
     Vbig = stages.function_space()
     test = TestFunction(Vbig)
     qpts = Q.get_points()
-    qwts = Q.get_weights()
-
-    tabulate_basis = L.tabulate(1, qpts)
-    basis_vals = tabulate_basis[(0,)]
-    basis_dvals = tabulate_basis[(1,)]
-    basis_vals_w = np.multiply(basis_vals, qwts)
-
-    # mass matrix later for BC
-    mmat = basis_vals_w @ basis_vals.T
-    # L2 projector
-    proj = vecconst(np.linalg.solve(mmat, basis_vals_w))
+    basis_vals, basis_dvals, basis_vals_w, proj, L_at_0 = tabulateDiscGalerkin(L, Q)
+    proj = vecconst(proj)
 
     trial_vals = vecconst(basis_vals)
     trial_dvals = vecconst(basis_dvals)
@@ -74,37 +125,39 @@ def getFormDiscGalerkin(F, L, Q, t, dt, u0, stages, bcs=None):
     qpts = vecconst(qpts.reshape((-1,)))
 
     split_form = extract_terms(F)
-    F_dtless = strip_dt_form(split_form.time)
-    F_remainder = split_form.remainder
+    dtu0 = TimeDerivative(u0)
 
-    # set up the pieces we need to work with to do our substitutions
+    # set up the pieces we need to work with to do our substitutions.
+    # We reshape rather than split: for mixed u0, split(stages) yields one
+    # piece per subspace of each stage rather than one per stage.
     v_np = np.reshape(test, (num_stages, *u0.ufl_shape))
     u_np = np.reshape(stages, (num_stages, *u0.ufl_shape))
     vsub = test_vals_w.T @ v_np
     usub = trial_vals.T @ u_np
     dtu0sub = trial_dvals.T @ u_np
 
-    # Jump terms
-    L_at_0 = vecconst(L.tabulate(0, (0.0,))[(0,)])
+    # Jump terms: the time derivative becomes the jump at the left
+    # endpoint, and any other occurrence of u its trace from the right,
+    # matching how the quadrature terms treat u and its time derivative.
+    # Note: a nonlinear mass term such as c(u)*Dt(u) is thus evaluated as
+    # c(U(0))*(U(0) - u0) here and c(U_q)*dU_q/dt below.  This differs on
+    # purpose from the strip_dt_form convention used in stage_value.py.
+    L_at_0 = vecconst(L_at_0)
     u_at_0 = L_at_0 @ u_np
     v_at_0 = L_at_0 @ v_np
-    repl = {u0: u_at_0 - u0,
+    repl = {u0: u_at_0,
+            dtu0: u_at_0 - u0,
             v: v_at_0}
-    Fnew = replace(F_dtless, repl)
-
-    # Terms with time derivatives
-    for q in range(len(qpts)):
-        repl = {t: t + qpts[q] * dt,
-                v: vsub[q] * dt,
-                u0: dtu0sub[q] / dt}
-        Fnew += replace(F_dtless, repl)
+    Fnew = replace(split_form.time, repl)
 
-    # Handle the rest of the terms
+    # Terms with time derivatives and the rest of the terms are
+    # handled by a single substitution at each quadrature point
     for q in range(len(qpts)):
         repl = {t: t + qpts[q] * dt,
                 v: vsub[q] * dt,
-                u0: usub[q]}
-        Fnew += replace(F_remainder, repl)
+                u0: usub[q],
+                dtu0: dtu0sub[q] / dt}
+        Fnew += replace(F, repl)
 
     # Oh, honey, is it the boundary conditions?
     if bcs is None:
@@ -112,11 +165,11 @@ def getFormDiscGalerkin(F, L, Q, t, dt, u0, stages, bcs=None):
     bcsnew = []
     for bc in bcs:
         g0 = as_ufl(bc._original_arg)
-        Vg_np = np.array([replace(g0, {t: t + c*dt}) for c in qpts])
-        g_np = proj @ Vg_np
+        Vg = [replace(g0, {t: t + c*dt}) for c in qpts]
         for i in range(num_stages):
             Vbigi = stage2spaces4bc(bc, V, Vbig, i)
-            bcsnew.append(bc.reconstruct(V=Vbigi, g=g_np[i]))
+            gi = sum(proj[i, q] * Vg[q] for q in range(len(Vg)))
+            bcsnew.append(bc.reconstruct(V=Vbigi, g=gi))
 
     return Fnew, bcsnew
 
@@ -171,21 +224,10 @@ class DiscontinuousGalerkinTimeStepper(StageCoupledTimeStepper):
         V = u0.function_space()
         self.num_fields = len(V)
 
-        ufc_line = ufc_simplex(1)
-
-        if order == 0:
-            self.el = DiscontinuousLagrange(ufc_line, order)
-        elif basis_type == "Bernstein":
-            self.el = DiscontinuousElement(Bernstein(ufc_line, order))
-        elif basis_type == "integral":
-            self.el = Legendre(ufc_line, order)
-        else:
-            # Let recursivenodes handle the general case
-            variant = None if basis_type == "Lagrange" else basis_type
-            self.el = DiscontinuousLagrange(ufc_line, order, variant=variant)
+        self.el = getElementDiscGalerkin(order, basis_type)
 
         if quadrature is None:
-            quadrature = make_quadrature(ufc_line, order+1)
+            quadrature = getQuadratureDiscGalerkin(order)
         self.quadrature = quadrature
         assert np.size(quadrature.get_points()) >= order+1
 
@@ -197,11 +239,35 @@ class DiscontinuousGalerkinTimeStepper(StageCoupledTimeStepper):
                          solver_parameters=solver_parameters,
                          appctx=appctx, nullspace=nullspace)
 
+        # Evaluating the stages at the end of the interval is the same
+        # combination at every step, so build it once per field
+        b = self.update_b
+        nf = self.num_fields
+        ws = self.stages.subfunctions
+        self.update_exprs = [sum(ws[nf * s + i] * b[s] for s in range(num_stages))
+                             for i in range(nf)]
+
+        # The coefficients of the constant function 1 in the temporal
+        # basis, used to seed the stages with u0 extended constantly in time
+        _, _, _, proj, _ = tabulateDiscGalerkin(self.el, self.quadrature)
+        const_coeffs = vecconst(proj.sum(axis=1))
+        self.predictor = [(ws[nf * s + i], u0bit * const_coeffs[s])
+                          for s in range(num_stages)
+                          for i, u0bit in enumerate(u0.subfunctions)]
+
+    def advance(self):
+        """Advances the system from time `t` to time `t + dt`, using
+        the constant-in-time extension of `u0` as the initial guess for
+        the stages.  Note: overwrites the value `u0`."""
+        for stage_bit, guess in self.predictor:
+            stage_bit.assign(guess)
+        super().advance()
+
     def get_form_and_bcs(self, stages):
         return getFormDiscGalerkin(self.F, self.el,
                                    self.quadrature, self.t, self.dt, self.u0, stages,
                                    self.orig_bcs)
 
     def _update(self):
-        for i, u0bit in enumerate(self.u0.subfunctions):
-            u0bit.assign(np.dot(self.stages.subfunctions[i::self.num_fields], self.update_b))
+        for u0bit, expr in zip(self.u0.subfunctions, self.update_exprs):
+            u0bit.assign(expr)
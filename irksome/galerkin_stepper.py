@@ -97,12 +97,12 @@ def getFormGalerkin(F, L_trial, L_test, Q, t, dt, u0, stages, bcs=None):
     for bc in bcs:
         u0_sub = bc2space(bc, u0)
         g0 = as_ufl(bc._original_arg)
-        Vg_np = np.array([replace(g0, {t: t + c * dt}) for c in qpts])
-        Vg_np -= u0_sub * trial_vals[0]
-        g_np = proj @ Vg_np
+        Vg = [replace(g0, {t: t + c * dt}) - u0_sub * trial_vals[0, q]
+              for q, c in enumerate(qpts)]
         for i in range(num_stages):
             Vbigi = stage2spaces4bc(bc, V, Vbig, i)
-            bcsnew.append(bc.reconstruct(V=Vbigi, g=g_np[i]))
+            gi = sum(proj[i, q] * Vg[q] for q in range(len(Vg)))
+            bcsnew.append(bc.reconstruct(V=Vbigi, g=gi))
 
     return Fnew, bcsnew
 
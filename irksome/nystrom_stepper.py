@@ -196,22 +196,27 @@ class StageDerivativeNystromTimeStepper(StageCoupledTimeStepper):
         self.updatebbar = vecconst(tableau.bbar)
         self.num_fields = len(u0.function_space())
 
-    def _update(self):
+        # The updates are fixed combinations of the stages, so we
+        # build the expressions for each field just once.
         b = self.updateb
         bbar = self.updatebbar
-        ns = self.tableau.num_stages
-        dt = self.dt
+        ns = tableau.num_stages
         nf = self.num_fields
+        kp = self.stages.subfunctions
+        self.update_exprs = [
+            (ut0bit * dt
+             + sum(kp[nf * s + i] * (bbar[s] * dt**2) for s in range(ns)),
+             sum(kp[nf * s + i] * (b[s] * dt) for s in range(ns)))
+            for i, ut0bit in enumerate(ut0.subfunctions)]
 
+    def _update(self):
         # Note: order matters here.  derivative update doesn't
         # depend on old solution value.
-        kp = self.stages.subfunctions
-        for i, (u0bit, ut0bit) in enumerate(zip(self.u0.subfunctions,
-                                                self.ut0.subfunctions)):
-            u0bit += (ut0bit * dt
-                      + sum(kp[nf * s + i] * (bbar[s] * dt**2)
-                            for s in range(ns)))
-            ut0bit += sum(kp[nf * s + i] * (b[s] * dt) for s in range(ns))
+        for u0bit, ut0bit, (du0, dut0) in zip(self.u0.subfunctions,
+                                              self.ut0.subfunctions,
+                                              self.update_exprs):
+            u0bit += du0
+            ut0bit += dut0
 
     def get_form_and_bcs(self, stages, tableau=None):
         if tableau is None:
@@ -2,7 +2,7 @@ import numpy
 from firedrake import Function, TestFunction
 from firedrake import NonlinearVariationalProblem as NLVP
 from firedrake import NonlinearVariationalSolver as NLVS
-from firedrake import assemble, dx, inner, norm
+from firedrake import dx, inner, norm
 
 from ufl.constantvalue import as_ufl, zero
 from .tools import AI, replace, vecconst
@@ -185,18 +185,22 @@ class StageDerivativeTimeStepper(StageCoupledTimeStepper):
                          butcher_tableau=butcher_tableau)
         self.appctx["stage_type"] = "deriv"
 
-    def _update(self):
-        """Assuming the algebraic problem for the RK stages has been
-        solved, updates the solution.  This will not typically be
-        called by an end user."""
+        # The update is the same combination of the stages at every
+        # step, so we build the expression for each field just once.
+        # Note: this now cates the optimized/stiffly accurate case as b[s] == Zero() will get dropped
         b = self.updateb
-        dt = self.dt
         ns = self.num_stages
         nf = self.num_fields
+        ws = self.stages.subfunctions
+        self.update_exprs = [sum(ws[nf * s + i] * (b[s] * dt) for s in range(ns))
+                             for i in range(nf)]
 
-        # Note: this now cates the optimized/stiffly accurate case as b[s] == Zero() will get dropped
-        for i, u0bit in enumerate(self.u0.subfunctions):
-            u0bit += sum(self.stages.subfunctions[nf * s + i] * (b[s] * dt) for s in range(ns))
+    def _update(self):
+        """Assuming the algebraic problem for the RK stages has been
+        solved, updates the solution.  This will not typically be
+        called by an end user."""
+        for u0bit, expr in zip(self.u0.subfunctions, self.update_exprs):
+            u0bit += expr
 
     def get_form_and_bcs(self, stages, butcher_tableau=None):
         if butcher_tableau is None:
@@ -305,34 +309,42 @@ class AdaptiveTimeStepper(StageDerivativeTimeStepper):
                      for bc in bcs]
         self.embbc = embbc
 
+        # The mass solve seeding the error estimate only depends on dt
+        # symbolically, so set it up once rather than on every step
+        if self.gamma0 != 0:
+            error_test = TestFunction(u0.function_space())
+            f_form = inner(self.error_func, error_test)*dx-self.gamma0*self.dt*self.dtless_form
+            f_problem = NLVP(f_form, self.error_func, bcs=self.embbc)
+            self.error_solver = NLVS(f_problem, solver_parameters=gamma0_params)
+
+        # Likewise cache the delta-b combination of the stages per field
+        delb = vecconst(self.delb)
+        ws = self.stages.subfunctions
+        nf = self.num_fields
+        ns = self.num_stages
+        self.error_exprs = [sum(ws[nf*s+i] * (delb[s]*self.dt) for s in range(ns))
+                            for i in range(nf)]
+
     def _estimate_error(self):
         """Assuming that the RK stages have been evaluated, estimates
         the temporal truncation error by taking the norm of the
         difference between the new solutions computed by the two
         methods.  Typically will not be called by the end user."""
-        dtc = float(self.dt)
-        delb = self.delb
-        ws = self.stages.subfunctions
-        nf = self.num_fields
-        ns = self.num_stages
-        u0 = self.u0
-
-        # Initialize e to be gamma*h*f(old value of u)
-        error_func = Function(u0.function_space())
+        error_func = self.error_func
+        error_bits = zip(error_func.subfunctions, self.error_exprs)
         # Only do the hard stuff if gamma0 is not zero
         if self.gamma0 != 0.0:
-            error_test = TestFunction(u0.function_space())
-            f_form = inner(error_func, error_test)*dx-self.gamma0*dtc*self.dtless_form
-            f_problem = NLVP(f_form, error_func, bcs=self.embbc)
-            f_solver = NLVS(f_problem, solver_parameters=self.gamma0_params)
-            f_solver.solve()
-
-        # Accumulate delta-b terms over stages
-        error_func_bits = error_func.subfunctions
-        for s in range(ns):
-            for i, e in enumerate(error_func_bits):
-                e += dtc*float(delb[s])*ws[nf*s+i]
-        return norm(assemble(error_func))
+            # Initialize e to be gamma*h*f(old value of u),
+            # then accumulate delta-b terms over stages
+            error_func.zero()
+            self.error_solver.solve()
+            for e, delta in error_bits:
+                e += delta
+        else:
+            # e is just the delta-b terms, so overwrite it directly
+            for e, delta in error_bits:
+                e.assign(delta)
+        return norm(error_func)
 
     def advance(self):
         """Attempts to advances the system from time `t` to time `t +
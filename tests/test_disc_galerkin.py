@@ -4,6 +4,7 @@ import pytest
 from firedrake import *
 from irksome import Dt, MeshConstant, DiscontinuousGalerkinTimeStepper
 from irksome import TimeStepper, RadauIIA
+from irksome.base_time_stepper import StageCoupledTimeStepper
 import FIAT
 
 
@@ -165,3 +166,144 @@ def test_1d_heat_homogeneous_dirichletbc(order):
         stepper_Radau.advance()
         t.assign(float(t) + float(dt))
         assert (errornorm(u_Radau, u) / norm(u)) < 1.e-10
+
+
+@pytest.mark.parametrize("order", [1, 2])
+def test_1d_heat_nonlinear_mass(order):
+    N = 8
+    msh = UnitIntervalMesh(N)
+    V = FunctionSpace(msh, "CG", 2)
+    MC = MeshConstant(msh)
+    dt = MC.Constant(0.1)
+    t = MC.Constant(0.0)
+    (x,) = SpatialCoordinate(msh)
+
+    # The mass term depends on u outside the time derivative, with
+    # c(Dt(u)) != c(u), so it must be evaluated at u and not at Dt(u).
+    # The solution is quadratic in space and linear in time, so the
+    # method reproduces it up to the nonlinear solver tolerance.
+    uexact = x*(1 - x)*(1 + t)
+    rhs = (2 + uexact)*Dt(uexact) - div(grad(uexact))
+    bcs = DirichletBC(V, uexact, "on_boundary")
+    u = Function(V)
+    u.interpolate(uexact)
+
+    v = TestFunction(V)
+    F = (
+        inner((2 + u)*Dt(u), v) * dx
+        + inner(grad(u), grad(v)) * dx
+        - inner(rhs, v) * dx
+    )
+
+    params = {"mat_type": "aij", "ksp_type": "preonly", "pc_type": "lu",
+              "snes_rtol": 1.e-12, "snes_atol": 1.e-14}
+
+    stepper = DiscontinuousGalerkinTimeStepper(
+        F, order, t, dt, u, bcs=bcs, solver_parameters=params
+    )
+
+    for _ in range(5):
+        stepper.advance()
+        t.assign(float(t) + float(dt))
+        assert errornorm(uexact, u) / norm(uexact) < 1.e-10
+
+
+@pytest.mark.parametrize("order", [0, 1, 2])
+@pytest.mark.parametrize("basis_type", ["Lagrange", "Bernstein", "spectral", "integral"])
+def test_predictor_constant_extension(order, basis_type):
+    msh = UnitIntervalMesh(8)
+    V = FunctionSpace(msh, "CG", 1)
+    MC = MeshConstant(msh)
+    dt = MC.Constant(0.1)
+    t = MC.Constant(0.0)
+    (x,) = SpatialCoordinate(msh)
+
+    u = Function(V).interpolate(1 + x**2)
+    u_init = Function(V).assign(u)
+    v = TestFunction(V)
+    F = inner(Dt(u), v) * dx + inner(grad(u), grad(v)) * dx
+
+    stepper = DiscontinuousGalerkinTimeStepper(
+        F, order, t, dt, u, basis_type=basis_type
+    )
+    for stage_bit, guess in stepper.predictor:
+        stage_bit.assign(guess)
+
+    # The seeded stages are constant in time, so evaluating them at
+    # the end of the interval must give back u0
+    stepper._update()
+    assert errornorm(u_init, u) < 1.e-12
+
+
+@pytest.mark.parametrize("order", [1, 2])
+@pytest.mark.parametrize("basis_type", ["Lagrange", "integral"])
+def test_predictor_nonlinear(order, basis_type):
+    N = 16
+    msh = UnitIntervalMesh(N)
+    V = FunctionSpace(msh, "CG", 1)
+    MC = MeshConstant(msh)
+    dt = MC.Constant(1.0 / N)
+    t = MC.Constant(0.0)
+    (x,) = SpatialCoordinate(msh)
+
+    u = Function(V).interpolate(sin(pi*x))
+    u_cold = Function(V).assign(u)
+    v = TestFunction(V)
+    F = inner(Dt(u), v) * dx + inner((1 + u**2)*grad(u), grad(v)) * dx
+    F_cold = replace(F, {u: u_cold})
+    bcs = DirichletBC(V, 0, "on_boundary")
+
+    params = {"mat_type": "aij", "ksp_type": "preonly", "pc_type": "lu",
+              "snes_rtol": 1.e-12, "snes_atol": 1.e-14}
+
+    stepper = DiscontinuousGalerkinTimeStepper(
+        F, order, t, dt, u, bcs=bcs, basis_type=basis_type,
+        solver_parameters=params
+    )
+    stepper_cold = DiscontinuousGalerkinTimeStepper(
+        F_cold, order, t, dt, u_cold, bcs=bcs, basis_type=basis_type,
+        solver_parameters=params
+    )
+
+    for _ in range(5):
+        stepper.advance()
+        # Skip the predictor, starting from the previous stage values
+        StageCoupledTimeStepper.advance(stepper_cold)
+        t.assign(float(t) + float(dt))
+        assert errornorm(u_cold, u) / norm(u_cold) < 1.e-8
+
+
+@pytest.mark.parametrize("order", [1, 2])
+@pytest.mark.parametrize("basis_type", ["Lagrange", "integral"])
+def test_vector_dirichletbc(order, basis_type):
+    msh = UnitSquareMesh(4, 4)
+    V = VectorFunctionSpace(msh, "CG", 1)
+    MC = MeshConstant(msh)
+    dt = MC.Constant(0.1)
+    t = MC.Constant(0.0)
+    x, y = SpatialCoordinate(msh)
+
+    # Linear in space and degree `order` in time, so that DG-in-time
+    # reproduces it exactly, including the time-dependent boundary data
+    uexact = as_vector([x + y * t**order, y - x * t**order])
+    rhs = Dt(uexact) - div(grad(uexact))
+    u = Function(V).interpolate(uexact)
+    v = TestFunction(V)
+    F = (
+        inner(Dt(u), v) * dx
+        + inner(grad(u), grad(v)) * dx
+        - inner(rhs, v) * dx
+    )
+    bcs = DirichletBC(V, uexact, "on_boundary")
+
+    luparams = {"mat_type": "aij", "ksp_type": "preonly", "pc_type": "lu"}
+
+    stepper = DiscontinuousGalerkinTimeStepper(
+        F, order, t, dt, u, bcs=bcs, basis_type=basis_type,
+        solver_parameters=luparams
+    )
+
+    for _ in range(5):
+        stepper.advance()
+        t.assign(float(t) + float(dt))
+        assert errornorm(uexact, u) < 1.e-10
@@ -215,3 +215,39 @@ def galerkin_wave(n, deg, alpha, order):
 def test_wave_eq_galerkin(deg, N, order):
     energy = galerkin_wave(N, deg, 0.3, order)
     assert np.allclose(energy[1:], energy[:-1])
+
+
+@pytest.mark.parametrize("order", [1, 2])
+@pytest.mark.parametrize("basis_type", ["Lagrange", "integral"])
+def test_vector_dirichletbc(order, basis_type):
+    msh = UnitSquareMesh(4, 4)
+    V = VectorFunctionSpace(msh, "CG", 1)
+    MC = MeshConstant(msh)
+    dt = MC.Constant(0.1)
+    t = MC.Constant(0.0)
+    x, y = SpatialCoordinate(msh)
+
+    # Linear in space and degree `order` in time, so that Galerkin-in-time
+    # reproduces it exactly, including the time-dependent boundary data
+    uexact = as_vector([x + y * t**order, y - x * t**order])
+    rhs = Dt(uexact) - div(grad(uexact))
+    u = Function(V).interpolate(uexact)
+    v = TestFunction(V)
+    F = (
+        inner(Dt(u), v) * dx
+        + inner(grad(u), grad(v)) * dx
+        - inner(rhs, v) * dx
+    )
+    bcs = DirichletBC(V, uexact, "on_boundary")
+
+    luparams = {"mat_type": "aij", "ksp_type": "preonly", "pc_type": "lu"}
+
+    stepper = GalerkinTimeStepper(
+        F, order, t, dt, u, bcs=bcs, basis_type=basis_type,
+        solver_parameters=luparams
+    )
+
+    for _ in range(5):
+        stepper.advance()
+        t.assign(float(t) + float(dt))
+        assert errornorm(uexact, u) < 1.e-10